@@ -0,0 +1,57 @@
+import argparse
+import logging
+import sys
+
+from skillcorner.export import EXPORT_ENDPOINTS, export_competition_edition
+
+DEFAULT_EXPORT_ENDPOINTS = 'tracking,data_collection,physical'
+
+
+def main(argv=None):
+    """Command line entry point, e.g.:
+
+    python -m skillcorner export --competition-edition 171 --endpoints tracking,data_collection,physical --out DIR
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m skillcorner', description='SkillCorner API client')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    export_parser = subparsers.add_parser('export', help='export endpoints data for a whole competition edition')
+    export_parser.add_argument('--competition-edition', type=int, required=True,
+                               help='id of the competition edition to export')
+    export_parser.add_argument('--endpoints', default=DEFAULT_EXPORT_ENDPOINTS,
+                               help=f"comma separated endpoints to export, available: {', '.join(EXPORT_ENDPOINTS)} "
+                                    f"(default: {DEFAULT_EXPORT_ENDPOINTS})")
+    export_parser.add_argument('--out', required=True, help='output directory')
+    export_parser.add_argument('--workers', type=int, default=None,
+                               help='number of worker processes (default: number of CPUs)')
+    export_parser.add_argument('--username', help='SkillCorner username (default: SKC_USERNAME env variable)')
+    export_parser.add_argument('--password', help='SkillCorner password (default: SKC_PASSWORD env variable)')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s', level=logging.WARNING)
+    logging.getLogger('skillcorner.export').setLevel(logging.INFO)
+
+    endpoints = list(dict.fromkeys(endpoint.strip() for endpoint in args.endpoints.split(',') if endpoint.strip()))
+    if not endpoints:
+        parser.error('No endpoints to export given.')
+    unknown_endpoints = [endpoint for endpoint in endpoints if endpoint not in EXPORT_ENDPOINTS]
+    if unknown_endpoints:
+        parser.error(f"Unknown endpoints: {', '.join(unknown_endpoints)}. "
+                     f"Available endpoints: {', '.join(EXPORT_ENDPOINTS)}.")
+
+    manifest = export_competition_edition(competition_edition=args.competition_edition,
+                                          endpoints=endpoints,
+                                          out=args.out,
+                                          workers=args.workers,
+                                          username=args.username,
+                                          password=args.password)
+
+    # Failures of endpoints exported in previous runs are kept in the manifest, only current ones set exit status.
+    return 1 if any(entry['endpoint'] in endpoints for entry in manifest['failed']) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,14 +2,26 @@ import json
 import logging
 import os
 import requests
+import tempfile
 from datetime import datetime, timedelta
 from functools import wraps
 from inspect import currentframe, getargvalues
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
 from requests.auth import HTTPBasicAuth
 from makefun import create_function
+from skillcorner.tracking import LazyTrackingData
 
 BASE_URL = 'https://skillcorner.com'
 DEFAULT_TIMEOUT = 70
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+PAGINATION_LIMIT = 300
+PAGINATION_MIN_LIMIT = 50
+# Client side upper bound, the API documentation does not state a maximal limit. It keeps pages of typical list
+# records at a few MB; a lower limit enforced by the server is detected from returned page sizes.
+PAGINATION_MAX_LIMIT = 5000
+TARGET_PAGE_DURATION = 2
+MAX_PAGE_BYTES = 20 * 1024 * 1024
 
 METHOD_DOCSTRING = 'Returns full {url} request response data in the json format. ' \
                    'To learn more about endpoint go to: https://skillcorner.com/api/docs/#{docs_url_anchor}\n'
@@ -176,6 +188,45 @@ def _freeze_args(func, id_name=None, request_data=None, **kwargs):
     return wrapper
 
 
+def _adapt_pagination_limit(limit, page_duration, page_records, page_bytes, max_limit):
+    """Computes pagination limit for the next page from the measurements of the previous one.
+
+    Bigger pages amortize the per request overhead, so the limit grows towards the amount of records fetched in
+    TARGET_PAGE_DURATION seconds, while staying below MAX_PAGE_BYTES of payload.
+    The limit changes at most by a factor of two per page and stays within PAGINATION_MIN_LIMIT and max_limit.
+
+    :param int limit: pagination limit used for the previous page
+    :param float page_duration: previous page request duration in seconds
+    :param int page_records: number of records in the previous page
+    :param int page_bytes: size of the previous page payload in bytes
+    :param int max_limit: maximal pagination limit accepted by the server
+    :return int: pagination limit for the next page
+    """
+
+    if not page_records:
+        return limit
+
+    target_limit = max_limit
+    if page_duration > 0:
+        target_limit = min(target_limit, TARGET_PAGE_DURATION * page_records / page_duration)
+    if page_bytes > 0:
+        target_limit = min(target_limit, MAX_PAGE_BYTES * page_records / page_bytes)
+
+    next_limit = int(max(limit / 2, min(limit * 2, target_limit)))
+    return min(max_limit, max(PAGINATION_MIN_LIMIT, next_limit))
+
+
+def _split_next_url(url):
+    """Splits paginated response 'next' url into url without query and list of query parameters.
+
+    :param string url: 'next' url returned in paginated response
+    :return tuple: url without query and list of (name, value) query parameters
+    """
+
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    return urlunsplit((scheme, netloc, path, '', fragment)), parse_qsl(query, keep_blank_values=True)
+
+
 class _MethodsGenerator(type):
     """Class generating all client methods used to request data from API.
 
@@ -288,12 +339,17 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
                 the username of the skillcorner service user
             password str:
                 password corresponding to the username
+            progress_callback callable:
+                called after each page of paginated requests with dict describing the progress: pages, records,
+                total_records, bytes, elapsed, records_per_second, bytes_per_second, eta and limit (pagination limit
+                requested for the page)
     """
 
-    def __init__(self, username=None, password=None):
+    def __init__(self, username=None, password=None, progress_callback=None):
         """
         :param username: string containing authorised username
         :param password: string containing valid password
+        :param progress_callback: callable called with progress dict after each page of paginated requests
         """
 
         logger.debug(f'Init client object')
@@ -307,9 +363,11 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
         logger.debug(f'Authentication class: HTTPBasicAuth')
         self.base_url = BASE_URL
         logger.debug(f'Base url: {self.base_url}')
+        self.progress_callback = progress_callback
 
     @_args_logging(logger)
-    def _skillcorner_request(self, url, method, params, paginated_request, timeout, json_data=None, pagination_limit=300):
+    def _skillcorner_request(self, url, method, params, paginated_request, timeout, json_data=None,
+                             pagination_limit=PAGINATION_LIMIT, stream_to=None):
         """Custom Skillcorner API request
 
         Custom request function using session object to persist parameters for Skillcorner host connection.
@@ -320,7 +378,10 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
         :param dict params: contains extra parameters for request
         :param int timeout: indicating request timeout in seconds
         :param boolean paginated_request: flag indicates if response should be paginated
-        :param int pagination_limit: indicates pagination limit
+        :param int pagination_limit: indicates initial pagination limit, adapted to measured pages unless 'limit'
+            is passed in params
+        :param stream_to: binary file object the raw response content of not paginated request is written to chunk
+            by chunk instead of being kept in memory, the file object is returned
         :return dict: contains response from server
         """
 
@@ -334,17 +395,18 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
             data = {}
 
             if paginated_request:
-                first_request_flag = True
                 start_timestamp = datetime.now()
+                adaptive_limit = 'limit' not in params.keys()
+                max_limit = PAGINATION_MAX_LIMIT
+                params = dict(params)
+                params.setdefault('limit', pagination_limit)
+                limit = params['limit']
+                results = []
+                pages = 0
+                received_bytes = 0
 
                 while url:
-                    if first_request_flag:
-                        if 'limit' not in params.keys():
-                            params['limit'] = pagination_limit
-                    else:
-                        if 'limit' in params.keys():
-                            del (params['limit'])
-
+                    page_timestamp = datetime.now()
                     skillcorner_response = skillcorner_session.request(url=url,
                                                                        method=method,
                                                                        json=json_data,
@@ -352,30 +414,57 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
                                                                        auth=self.auth,
                                                                        timeout=timeout)
                     skillcorner_response.raise_for_status()
+                    page_duration = (datetime.now() - page_timestamp).total_seconds()
                     resp = skillcorner_response.json()
-                    request_duration = datetime.now() - start_timestamp
-
-                    if not data:
-                        data = skillcorner_response.json()
-                        estimated_request_amount = data['count'] / pagination_limit
-                        estimated_request_duration = timedelta(
-                            seconds=(estimated_request_amount * request_duration.total_seconds()))
-
-                        if estimated_request_duration >= timedelta(seconds=6):
-                            logger.warning(f"WARNING: Estimated request duration: {estimated_request_duration}.\n"
-                                           "This request may take a while as it retrieves big amount of data. "
-                                           "If needed, please use Ctrl+C to stop the request and call method with "
-                                           "'params' argument to reduce its response time and obtain more precise "
-                                           "results (e.g. get_matches(params={'season': 6})). For more details about "
-                                           "'params' usage, go to: https://skillcorner.com/api/docs/.")
-
-                    else:
-                        data["results"].extend(skillcorner_response.json()["results"])
+                    page_bytes = len(skillcorner_response.content)
 
+                    page_limit = limit
+                    results.extend(resp['results'])
+                    pages += 1
+                    received_bytes += page_bytes
                     url = resp['next']
-                    first_request_flag = False
 
-                data = data['results']
+                    if url:
+                        url, params = _split_next_url(url)
+                        if adaptive_limit:
+                            if len(resp['results']) < limit:
+                                # Server caps the limit silently, use the received page size as upper bound.
+                                max_limit = len(resp['results'])
+                            limit = _adapt_pagination_limit(limit, page_duration, len(resp['results']), page_bytes,
+                                                            max_limit)
+                            params = [(name, value) for name, value in params if name != 'limit']
+                            params.append(('limit', limit))
+
+                    elapsed = datetime.now() - start_timestamp
+                    elapsed_seconds = max(elapsed.total_seconds(), 1e-6)
+                    records_per_second = len(results) / elapsed_seconds
+                    remaining_records = max(resp['count'] - len(results), 0) if url else 0
+                    progress = {
+                        'pages': pages,
+                        'records': len(results),
+                        'total_records': resp['count'],
+                        'bytes': received_bytes,
+                        'elapsed': elapsed,
+                        'records_per_second': records_per_second,
+                        'bytes_per_second': received_bytes / elapsed_seconds,
+                        'eta': timedelta(seconds=remaining_records / records_per_second) if records_per_second
+                        else None,
+                        'limit': page_limit,
+                    }
+                    logger.info(f"Page {pages}: {len(results)}/{resp['count']} records, "
+                                f"{records_per_second:.1f} records/s, ETA: {progress['eta']}")
+                    if self.progress_callback:
+                        self.progress_callback(progress)
+
+                    if pages == 1 and progress['eta'] and progress['eta'] >= timedelta(seconds=6):
+                        logger.warning(f"WARNING: Estimated request duration: {elapsed + progress['eta']}.\n"
+                                       "This request may take a while as it retrieves big amount of data. "
+                                       "If needed, please use Ctrl+C to stop the request and call method with "
+                                       "'params' argument to reduce its response time and obtain more precise "
+                                       "results (e.g. get_matches(params={'season': 6})). For more details about "
+                                       "'params' usage, go to: https://skillcorner.com/api/docs/.")
+
+                data = results
                 end_timestamp = datetime.now()
 
             else:
@@ -386,13 +475,20 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
                                                                    json=json_data,
                                                                    params=params,
                                                                    auth=self.auth,
-                                                                   timeout=timeout)
+                                                                   timeout=timeout,
+                                                                   stream=stream_to is not None)
                 skillcorner_response.raise_for_status()
 
-                try:
-                    data = skillcorner_response.json()
-                except json.decoder.JSONDecodeError:
-                    data = skillcorner_response.content
+                if stream_to is not None:
+                    for chunk in skillcorner_response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        stream_to.write(chunk)
+                    stream_to.flush()
+                    data = stream_to
+                else:
+                    try:
+                        data = skillcorner_response.json()
+                    except json.decoder.JSONDecodeError:
+                        data = skillcorner_response.content
                 end_timestamp = datetime.now()
 
             full_request_duration = end_timestamp - start_timestamp
@@ -403,6 +499,33 @@ class SkillcornerClient(metaclass=_MethodsGenerator):
 
             return data
 
+    def get_lazy_match_tracking_data(self, match_id, params=None):
+        """Returns /api/match/{match_id}/tracking request response data as lazily parsed frames.
+
+        The response is streamed to a temporary file, so it is never held in memory as a whole, and the file is
+        memory mapped. Frames are decoded from it only when iterated over or accessed by index, e.g. data[:600]
+        decodes just the first minute of the match. Note that the download itself completes before the first frame is
+        available. Close the returned object (or use it as a context manager) to remove the temporary file.
+
+        :param int match_id: id of the match
+        :param dict params: contains extra parameters for request
+        :return LazyTrackingData: lazy sequence of tracking data frames
+        """
+
+        url = METHOD_URL_ID_BINDING['_get_match_tracking_data']['url'].format(match_id)
+        file = tempfile.TemporaryFile()
+        try:
+            self._skillcorner_request(url=url,
+                                      method='GET',
+                                      params=params,
+                                      paginated_request=False,
+                                      timeout=DEFAULT_TIMEOUT,
+                                      stream_to=file)
+        except Exception:
+            file.close()
+            raise
+        return LazyTrackingData.from_file(file)
+
     def _get_data(self, *, url, paginated_request, timeout, params=None):
         """General get... function
 
@@ -59,3 +59,20 @@ client.get_and_save_match_tracking_data(match_id=49364, filepath="tracking_data.
 client.get_and_save_match_video_tracking_data(match_id=63743, filepath="video_tracking_data.json",
                                               params={"frame__gt": 58500})
 client.get_and_save_match_data_collection(match_id=62100, filepath="data_collection.json")
+
+# Get tracking data parsed lazily, frame by frame
+with client.get_lazy_match_tracking_data(match_id=49364) as data:
+    print(data[:600])
+    print(data.get_period(2))
+    for frame in data:
+        print(frame)
+
+# Export whole competition edition from the command line:
+# python -m skillcorner export --competition-edition 171 --endpoints tracking,data_collection,physical --out export
+
+# Follow progress of paginated requests
+client = SkillcornerClient(username='PUT_YOUR_LOGIN_HERE', password='PUT_YOUR_PASSWORD_HERE',
+                           progress_callback=lambda progress: print(f"{progress['records']}/"
+                                                                    f"{progress['total_records']} records, "
+                                                                    f"ETA: {progress['eta']}"))
+data = client.get_players(params={'competition_edition': 115})
@@ -0,0 +1,179 @@
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from skillcorner.client import DEFAULT_TIMEOUT, METHOD_URL_BINDING, METHOD_URL_ID_BINDING, SkillcornerClient
+
+MANIFEST_FILENAME = 'manifest.json'
+
+EXPORT_ENDPOINTS = {
+    'match': {
+        'url': METHOD_URL_ID_BINDING['_get_match']['url'],
+        'match_param': None,
+    },
+    'tracking': {
+        'url': METHOD_URL_ID_BINDING['_get_match_tracking_data']['url'],
+        'match_param': None,
+    },
+    'data_collection': {
+        'url': METHOD_URL_ID_BINDING['_get_match_data_collection']['url'],
+        'match_param': None,
+    },
+    'physical': {
+        'url': METHOD_URL_BINDING['_get_physical']['url'],
+        'match_param': 'match',
+    },
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _partition_path(endpoint, match_id):
+    """Returns path of the exported file relative to the competition edition directory.
+
+    :param string endpoint: name of the exported endpoint
+    :param int match_id: id of the exported match
+    :return string: relative path of the compressed file
+    """
+
+    return os.path.join(f'endpoint={endpoint}', f'match_id={match_id}.json.gz')
+
+
+def _read_manifest(manifest_filepath):
+    """Reads manifest of a previous export, if any.
+
+    :param string manifest_filepath: path to the manifest file
+    :return dict: previous manifest or empty manifest
+    """
+
+    if not os.path.exists(manifest_filepath):
+        return {'endpoints': [], 'files': [], 'failed': []}
+    with open(manifest_filepath) as file:
+        return json.load(file)
+
+
+def _export_file(client_class, username, password, endpoint, match_id, filepath):
+    """Downloads one endpoint response for one match and writes it gzip compressed.
+
+    Runs in a worker process. The raw response content is streamed chunk by chunk into a gzip file, so neither the
+    whole response nor its JSON decoding is held in memory. The file is written under a temporary name and renamed
+    once complete, so an existing file is always a complete export.
+
+    :return int: size of the written file in bytes
+    """
+
+    endpoint_config = EXPORT_ENDPOINTS[endpoint]
+    if endpoint_config['match_param']:
+        url = endpoint_config['url']
+        params = {endpoint_config['match_param']: match_id}
+    else:
+        url = endpoint_config['url'].format(match_id)
+        params = None
+
+    client = client_class(username=username, password=password)
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    tmp_filepath = f'{filepath}.{os.getpid()}.tmp'
+    try:
+        with gzip.open(tmp_filepath, 'wb') as file:
+            client._skillcorner_request(url=url,
+                                        method='GET',
+                                        params=params,
+                                        paginated_request=False,
+                                        timeout=DEFAULT_TIMEOUT,
+                                        stream_to=file)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+    return os.path.getsize(filepath)
+
+
+def export_competition_edition(competition_edition, endpoints, out, workers=None, username=None, password=None,
+                               client_class=SkillcornerClient):
+    """Exports chosen endpoints for all matches of a competition edition.
+
+    Matches are resolved with get_matches and downloads are spread across a process pool. Files are stored gzip
+    compressed in {out}/competition_edition={id}/endpoint={endpoint}/match_id={id}.json.gz next to a manifest.json
+    listing them. Files already present are complete exports and are not downloaded again. The manifest of a previous
+    export into the same directory is merged with the current one, keyed by endpoint and match.
+
+    :param int competition_edition: id of the competition edition
+    :param list endpoints: names of endpoints to export, keys of EXPORT_ENDPOINTS
+    :param string out: output directory
+    :param int workers: number of worker processes, defaults to the number of CPUs
+    :param string username: string containing authorised username
+    :param string password: string containing valid password
+    :param client_class: client class used to request data
+    :return dict: manifest of the export
+    """
+
+    endpoints = list(dict.fromkeys(endpoints))
+    unknown_endpoints = set(endpoints) - set(EXPORT_ENDPOINTS)
+    if unknown_endpoints:
+        raise ValueError(f"Unknown endpoints: {', '.join(sorted(unknown_endpoints))}. "
+                         f"Available endpoints: {', '.join(EXPORT_ENDPOINTS)}.")
+
+    edition_dir = os.path.join(out, f'competition_edition={competition_edition}')
+    client = client_class(username=username, password=password)
+    matches = client.get_matches(params={'competition_edition': competition_edition})
+    logger.info(f'Found {len(matches)} matches for competition edition {competition_edition}')
+
+    files = []
+    pending = []
+    for match in matches:
+        for endpoint in endpoints:
+            path = _partition_path(endpoint, match['id'])
+            entry = {'match_id': match['id'], 'endpoint': endpoint, 'path': path}
+            files.append(entry)
+            filepath = os.path.join(edition_dir, path)
+            if os.path.exists(filepath):
+                entry['size'] = os.path.getsize(filepath)
+            else:
+                pending.append(entry)
+    logger.info(f'Skipping {len(files) - len(pending)} already exported files, downloading {len(pending)} files')
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_export_file, client_class, username, password, entry['endpoint'],
+                                   entry['match_id'], os.path.join(edition_dir, entry['path'])): entry
+                   for entry in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            entry = futures[future]
+            try:
+                entry['size'] = future.result()
+            except Exception as error:
+                logger.error(f"Failed to export {entry['endpoint']} for match {entry['match_id']}: {error}")
+                failed.append(entry)
+            else:
+                logger.info(f"Exported {entry['path']} ({done}/{len(pending)})")
+
+    manifest_filepath = os.path.join(edition_dir, MANIFEST_FILENAME)
+    previous_manifest = _read_manifest(manifest_filepath)
+    exported_files = {(entry['endpoint'], entry['match_id']): entry for entry in previous_manifest['files']
+                      if os.path.exists(os.path.join(edition_dir, entry['path']))}
+    failed_files = {(entry['endpoint'], entry['match_id']): entry for entry in previous_manifest['failed']}
+    for entry in files:
+        if 'size' in entry:
+            exported_files[(entry['endpoint'], entry['match_id'])] = entry
+            failed_files.pop((entry['endpoint'], entry['match_id']), None)
+    for entry in failed:
+        failed_files[(entry['endpoint'], entry['match_id'])] = entry
+
+    manifest = {
+        'competition_edition': competition_edition,
+        'endpoints': list(dict.fromkeys(previous_manifest['endpoints'] + list(endpoints))),
+        'exported_at': datetime.now().isoformat(),
+        'files': list(exported_files.values()),
+        'failed': list(failed_files.values()),
+    }
+    os.makedirs(edition_dir, exist_ok=True)
+    with open(f'{manifest_filepath}.tmp', 'w') as file:
+        json.dump(manifest, file, indent=4)
+    os.replace(f'{manifest_filepath}.tmp', manifest_filepath)
+    logger.info(f'Manifest written to: {manifest_filepath}')
+
+    return manifest
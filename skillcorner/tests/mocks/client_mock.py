@@ -2,7 +2,7 @@ import os
 import json
 import logging
 
-from skillcorner.client import SkillcornerClient
+from skillcorner.client import PAGINATION_LIMIT, SkillcornerClient
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +29,21 @@ class MockSkillcornerClient(SkillcornerClient):
         super(MockSkillcornerClient, self).__init__(*args, **kwargs)
         logger.debug(f'Creating Skillcorner mock client instance')
 
-    def _skillcorner_request(self, url, method, params, paginated_request, timeout, pagination_limit=300):
+    def _skillcorner_request(self, url, method, params, paginated_request, timeout, pagination_limit=PAGINATION_LIMIT,
+                             stream_to=None):
         """
         Mocked skillcorner_request method returning fake json response read from file.
 
         :return: json dict with fake response data
         """
-        if url.startswith('/'):
-            url = url[1:]
+        url = url.strip('/')
         file_path = os.path.join('skillcorner', 'tests', 'fixtures', f'{url}.json')
+        if stream_to is not None:
+            logger.debug(f'Streaming file data as raw response: {file_path}')
+            with open(file_path, 'rb') as file:
+                stream_to.write(file.read())
+            stream_to.flush()
+            return stream_to
         logger.debug(f'Loading file data as json response: {file_path}')
         with open(file_path) as file:
             data = FakeResponse(json.load(file))
@@ -0,0 +1,142 @@
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import patch
+
+from skillcorner.__main__ import main
+from skillcorner.export import _export_file, export_competition_edition
+from skillcorner.tests.mocks.client_mock import MockSkillcornerClient
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join('skillcorner', 'tests', 'fixtures', 'api')
+
+
+class TestExportMocked(TestCase):
+    """
+    Test class for mocked competition edition export.
+    """
+    def setUp(self):
+        self.out = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out)
+
+    def test_export_competition_edition(self):
+        """
+        Test verifying exported files match endpoint responses and are listed in the manifest
+        """
+        logger.info("Start test for competition edition export.")
+        manifest = export_competition_edition(competition_edition=171,
+                                              endpoints=['tracking', 'data_collection', 'physical'],
+                                              out=self.out,
+                                              workers=2,
+                                              client_class=MockSkillcornerClient)
+        self.assertEqual(manifest['failed'], [])
+        self.assertEqual(len(manifest['files']), 3)
+
+        edition_dir = os.path.join(self.out, 'competition_edition=171')
+        with open(os.path.join(edition_dir, 'manifest.json')) as file:
+            self.assertEqual(json.load(file), manifest)
+
+        expected_fixtures = {
+            'tracking': os.path.join(FIXTURES_DIR, 'match', '42586', 'tracking.json'),
+            'data_collection': os.path.join(FIXTURES_DIR, 'match', '42586', 'data_collection.json'),
+            'physical': os.path.join(FIXTURES_DIR, 'physical.json'),
+        }
+        for entry in manifest['files']:
+            with gzip.open(os.path.join(edition_dir, entry['path'])) as file, \
+                    open(expected_fixtures[entry['endpoint']], 'rb') as expected_file:
+                self.assertEqual(file.read(), expected_file.read())
+
+    def test_export_skips_complete_files(self):
+        """
+        Test verifying already exported files are not downloaded again
+        """
+        filepath = os.path.join(self.out, 'competition_edition=171', 'endpoint=tracking', 'match_id=42586.json.gz')
+        os.makedirs(os.path.dirname(filepath))
+        with gzip.open(filepath, 'wb') as file:
+            file.write(b'[]')
+
+        manifest = export_competition_edition(competition_edition=171,
+                                              endpoints=['tracking'],
+                                              out=self.out,
+                                              workers=1,
+                                              client_class=MockSkillcornerClient)
+        self.assertEqual(manifest['files'][0]['size'], os.path.getsize(filepath))
+        with gzip.open(filepath) as file:
+            self.assertEqual(file.read(), b'[]')
+
+    def test_export_merges_manifest(self):
+        """
+        Test verifying consecutive exports of different endpoints are all listed in the manifest
+        """
+        export_competition_edition(competition_edition=171, endpoints=['tracking'], out=self.out, workers=1,
+                                   client_class=MockSkillcornerClient)
+        manifest = export_competition_edition(competition_edition=171, endpoints=['physical'], out=self.out,
+                                              workers=1, client_class=MockSkillcornerClient)
+
+        self.assertEqual(manifest['endpoints'], ['tracking', 'physical'])
+        self.assertEqual(sorted((entry['endpoint'], entry['match_id']) for entry in manifest['files']),
+                         [('physical', 42586), ('tracking', 42586)])
+        with open(os.path.join(self.out, 'competition_edition=171', 'manifest.json')) as file:
+            self.assertEqual(json.load(file), manifest)
+
+    def test_export_duplicated_endpoints(self):
+        """
+        Test verifying duplicated endpoints are exported once
+        """
+        manifest = export_competition_edition(competition_edition=171, endpoints=['tracking', 'tracking'],
+                                              out=self.out, workers=2, client_class=MockSkillcornerClient)
+        self.assertEqual(manifest['endpoints'], ['tracking'])
+        self.assertEqual(len(manifest['files']), 1)
+
+    def test_export_removes_temporary_file_on_failure(self):
+        """
+        Test verifying temporary file is removed when writing exported file fails
+        """
+        filepath = os.path.join(self.out, 'endpoint=tracking', 'match_id=42586.json.gz')
+        with patch('skillcorner.export.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                _export_file(MockSkillcornerClient, None, None, 'tracking', 42586, filepath)
+        self.assertEqual(os.listdir(os.path.dirname(filepath)), [])
+
+    def test_export_removes_temporary_file_on_download_failure(self):
+        """
+        Test verifying temporary file is removed when streaming the response fails
+        """
+        filepath = os.path.join(self.out, 'endpoint=tracking', 'match_id=42586.json.gz')
+        with patch.object(MockSkillcornerClient, '_skillcorner_request', side_effect=IOError('connection reset')):
+            with self.assertRaises(IOError):
+                _export_file(MockSkillcornerClient, None, None, 'tracking', 42586, filepath)
+        self.assertEqual(os.listdir(os.path.dirname(filepath)), [])
+
+    def test_export_unknown_endpoint(self):
+        """
+        Test verifying unknown endpoint is rejected by the command line entry point
+        """
+        with self.assertRaises(SystemExit):
+            main(['export', '--competition-edition', '171', '--endpoints', 'tracking,unknown', '--out', self.out])
+
+    def test_export_empty_endpoints(self):
+        """
+        Test verifying empty endpoint list is rejected by the command line entry point
+        """
+        for endpoints in (',', ' , '):
+            with self.assertRaises(SystemExit):
+                main(['export', '--competition-edition', '171', '--endpoints', endpoints, '--out', self.out])
+        self.assertEqual(os.listdir(self.out), [])
+
+    def test_export_command_propagates_errors(self):
+        """
+        Test verifying errors raised during the export are not reported as usage errors
+        """
+        error = json.JSONDecodeError('corrupt manifest', '', 0)
+        with patch('skillcorner.__main__.export_competition_edition', side_effect=error):
+            with self.assertRaises(json.JSONDecodeError):
+                main(['export', '--competition-edition', '171', '--endpoints', 'tracking', '--out', self.out])
@@ -0,0 +1,102 @@
+import json
+import logging
+from unittest import TestCase
+from urllib.parse import urlencode
+
+import requests
+from mock import patch, MagicMock
+
+from skillcorner.client import PAGINATION_LIMIT, PAGINATION_MIN_LIMIT, SkillcornerClient, _adapt_pagination_limit
+
+logger = logging.getLogger(__name__)
+
+
+class FakePaginatedServer:
+    """
+    Fake server answering limit/offset paginated requests, capping limit as the server does.
+    """
+    def __init__(self, count, max_limit):
+        self.count = count
+        self.max_limit = max_limit
+        self.requested_limits = []
+
+    def request(self, url, params, **kwargs):
+        params = dict(params)
+        limit = int(params.pop('limit'))
+        offset = int(params.pop('offset', 0))
+        self.requested_limits.append(limit)
+        limit = min(limit, self.max_limit)
+
+        next_url = None
+        if offset + limit < self.count:
+            next_url = f'{url}?{urlencode(dict(params, limit=limit, offset=offset + limit))}'
+        body = {
+            'count': self.count,
+            'next': next_url,
+            'previous': None,
+            'results': [{'id': i, 'season': str(params.get('season'))}
+                        for i in range(offset, min(offset + limit, self.count))],
+        }
+
+        response = requests.models.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        return response
+
+
+class TestPaginationMock(TestCase):
+    """
+    Test class for adaptive pagination of paginated requests.
+    """
+    def _patch_session(self, server):
+        request_mock = MagicMock()
+        request_mock.request = MagicMock(side_effect=server.request)
+        requests.Session.return_value.__enter__.return_value = request_mock
+
+    @patch('requests.Session')
+    def test_adaptive_pagination(self, mock_session):
+        """
+        Test verifying page size grows within server bounds and all records are returned in order
+        """
+        logger.info("Start test for adaptive pagination.")
+        server = FakePaginatedServer(count=10000, max_limit=1000)
+        self._patch_session(server)
+        progress = []
+        client = SkillcornerClient(username='username', password='password', progress_callback=progress.append)
+
+        data = client.get_matches(params={'season': 6})
+
+        self.assertEqual(data, [{'id': i, 'season': '6'} for i in range(10000)])
+        self.assertEqual(server.requested_limits[0], PAGINATION_LIMIT)
+        self.assertGreater(max(server.requested_limits), PAGINATION_LIMIT)
+        self.assertTrue(all(limit <= 1000 for limit in server.requested_limits[3:]))
+        self.assertEqual(len(progress), len(server.requested_limits))
+        self.assertEqual([page['limit'] for page in progress], server.requested_limits)
+        self.assertEqual(progress[-1]['records'], 10000)
+        self.assertEqual(progress[-1]['total_records'], 10000)
+        self.assertEqual(progress[-1]['eta'].total_seconds(), 0)
+
+    @patch('requests.Session')
+    def test_fixed_pagination_limit(self, mock_session):
+        """
+        Test verifying 'limit' passed in params is used for all pages
+        """
+        server = FakePaginatedServer(count=1000, max_limit=1000)
+        self._patch_session(server)
+        client = SkillcornerClient(username='username', password='password')
+
+        data = client.get_matches(params={'limit': 100})
+
+        self.assertEqual(len(data), 1000)
+        self.assertEqual(server.requested_limits, [100] * 10)
+
+    def test_adapt_pagination_limit(self):
+        """
+        Test verifying page size follows measured page duration and payload size
+        """
+        self.assertEqual(_adapt_pagination_limit(300, 0.1, 300, 30000, 5000), 600)
+        self.assertEqual(_adapt_pagination_limit(300, 8, 300, 30000, 5000), 150)
+        self.assertEqual(_adapt_pagination_limit(300, 2, 300, 30000, 5000), 300)
+        self.assertEqual(_adapt_pagination_limit(300, 0.1, 300, 30000, 400), 400)
+        self.assertEqual(_adapt_pagination_limit(60, 100, 60, 30000, 5000), PAGINATION_MIN_LIMIT)
+        self.assertEqual(_adapt_pagination_limit(300, 0.1, 300, 300 * 1024 * 1024, 5000), 150)
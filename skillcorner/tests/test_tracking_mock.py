@@ -0,0 +1,150 @@
+import io
+import json
+import logging
+import os
+from unittest import TestCase
+
+import requests
+from mock import patch, MagicMock
+
+from skillcorner.client import SkillcornerClient
+from skillcorner.tests.mocks.client_mock import MockSkillcornerClient
+from skillcorner.tracking import LazyTrackingData
+
+logger = logging.getLogger(__name__)
+
+TRACKING_FIXTURE = os.path.join('skillcorner', 'tests', 'fixtures', 'api', 'match', '42586', 'tracking.json')
+
+
+class TestLazyTrackingDataMocked(TestCase):
+    """
+    Test class for lazily parsed tracking data.
+    """
+    def setUp(self):
+        with open(TRACKING_FIXTURE) as file:
+            self.expected = json.load(file)
+
+    def test_get_lazy_match_tracking_data(self):
+        """
+        Test verifying lazy tracking data matches fully parsed response
+        """
+        logger.info("Start test for lazy tracking data endpoint.")
+        client = MockSkillcornerClient()
+        with client.get_lazy_match_tracking_data(match_id=42586) as data:
+            self.assertIsInstance(data, LazyTrackingData)
+            self.assertEqual(list(data), self.expected)
+            self.assertEqual(len(data), len(self.expected))
+
+    @patch('requests.Session')
+    def test_get_lazy_match_tracking_data_streamed(self, mock_session):
+        """
+        Test verifying tracking data response is streamed instead of read as a whole
+        """
+        response = requests.models.Response()
+        response.status_code = 200
+        with open(TRACKING_FIXTURE, 'rb') as file:
+            response.raw = io.BytesIO(file.read())
+        request_mock = MagicMock()
+        request_mock.request = MagicMock(return_value=response)
+        requests.Session.return_value.__enter__.return_value = request_mock
+
+        client = SkillcornerClient(username='username', password='password')
+        with client.get_lazy_match_tracking_data(match_id=42586) as data:
+            self.assertEqual(data[-1], self.expected[-1])
+            self.assertEqual(list(data), self.expected)
+        self.assertTrue(request_mock.request.call_args[1]['stream'])
+
+    def test_indexing_and_slicing(self):
+        """
+        Test verifying frames are accessible by index and slice before and after full indexing
+        """
+        with open(TRACKING_FIXTURE, 'rb') as file:
+            data = LazyTrackingData(file.read())
+        self.assertEqual(data[1], self.expected[1])
+        self.assertEqual(data[1:3], self.expected[1:3])
+        self.assertEqual(data[-1], self.expected[-1])
+        self.assertEqual(data[::-2], self.expected[::-2])
+        self.assertEqual(data[2]['possession']['group'], 'away team, [sic] {"brackets"}')
+        with self.assertRaises(IndexError):
+            data[len(self.expected)]
+
+    def test_frame_and_period_lookup(self):
+        """
+        Test verifying frames are selected by frame number and period, indexing source only as far as needed
+        """
+        with open(TRACKING_FIXTURE, 'rb') as file:
+            data = LazyTrackingData(file.read())
+        self.assertEqual(data.get_frames(10, 12), self.expected[0:2])
+        self.assertEqual(len(data._offsets), 3)
+        self.assertEqual(data.get_period(1), self.expected[0:3])
+        self.assertEqual(data.get_period(2), self.expected[3:])
+        self.assertEqual(data.get_period(3), [])
+        self.assertEqual(data.get_frames(11, 13), self.expected[1:3])
+        self.assertEqual(data.get_frames(0, 100), self.expected)
+        self.assertEqual(data.get_frames(100, 200), [])
+
+        gapped = LazyTrackingData(json.dumps([self.expected[0], self.expected[3]]).encode())
+        self.assertEqual(gapped.get_frames(11, 14), [self.expected[3]])
+
+    def test_small_window(self):
+        """
+        Test verifying frames crossing window edges are decoded from all supported source formats
+        """
+        frames = [{'frame': number, 'period': 1 if number < 40 else 2, 'possession': {'group': 'équipe, [x]'},
+                   'data': [{'track_id': track_id, 'x': number / 10} for track_id in range(number % 4)]}
+                  for number in range(80)]
+        sources = {
+            'array': json.dumps(frames, indent=4, ensure_ascii=False).encode(),
+            'compact': json.dumps(frames, separators=(',', ':')).encode(),
+            'ndjson': b'\n'.join(json.dumps(frame, ensure_ascii=False).encode() for frame in frames) + b'\n',
+        }
+        for window_size in (1, 7, 64):
+            for name, source in sources.items():
+                with self.subTest(window_size=window_size, source=name), \
+                        patch('skillcorner.tracking.WINDOW_SIZE', window_size):
+                    self.assertEqual(list(LazyTrackingData(source)), frames)
+                    self.assertEqual(LazyTrackingData(source)[35:45], frames[35:45])
+                    self.assertEqual(LazyTrackingData(source)[::-3], frames[::-3])
+                    self.assertEqual(LazyTrackingData(source).get_period(2), frames[40:])
+                    self.assertEqual(LazyTrackingData(source).get_frames(20, 30), frames[20:30])
+
+    def test_from_file(self):
+        """
+        Test verifying tracking data backed by memory mapped file
+        """
+        with LazyTrackingData.from_file(TRACKING_FIXTURE) as data:
+            self.assertEqual(data[3], self.expected[3])
+            self.assertEqual(list(data), self.expected)
+
+    def test_from_file_closes_file_on_failure(self):
+        """
+        Test verifying file opened from path is closed when it can not be memory mapped
+        """
+        file = open(TRACKING_FIXTURE, 'rb')
+        with patch('skillcorner.tracking.open', return_value=file, create=True), \
+                patch('skillcorner.tracking.mmap.mmap', side_effect=OSError('unmappable')):
+            with self.assertRaises(OSError):
+                LazyTrackingData.from_file(TRACKING_FIXTURE)
+        self.assertTrue(file.closed)
+
+    def test_compact_and_empty_arrays(self):
+        """
+        Test verifying arrays without whitespace and empty arrays
+        """
+        data = LazyTrackingData(json.dumps(self.expected, separators=(',', ':')).encode())
+        self.assertEqual(list(data), self.expected)
+        self.assertEqual(len(LazyTrackingData(b'[ ]')), 0)
+        with self.assertRaises(ValueError):
+            list(LazyTrackingData(b'[{"frame": 1}'))
+
+    def test_newline_delimited_frames(self):
+        """
+        Test verifying newline delimited JSON frames
+        """
+        source = b'\n'.join(json.dumps(frame).encode() for frame in self.expected) + b'\n'
+        data = LazyTrackingData(source)
+        self.assertEqual(data[2], self.expected[2])
+        self.assertEqual(list(data), self.expected)
+        self.assertEqual(len(LazyTrackingData(b'')), 0)
+        with self.assertRaises(ValueError):
+            list(LazyTrackingData(b'{"frame": 1}\nnot json\n'))
@@ -0,0 +1,266 @@
+import json
+import logging
+from bisect import bisect_left
+import mmap
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r'\s*')
+_SEPARATORS = re.compile(r'[\s,]*')
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+_END = object()
+
+
+class LazyTrackingData:
+    """Lazy, incrementally parsed tracking data.
+
+    Wraps raw tracking data bytes or a tracking data file and parses frames only when they are iterated over or
+    accessed by index. Both a JSON array of frames and newline delimited JSON frames (one frame per line) are
+    supported. Frames are decoded one at a time from a sliding window of the source, so memory does not grow with
+    match length. Byte offsets, frame numbers and periods of frames are indexed on the first pass, so every later
+    access to an already indexed frame costs a single frame decoding.
+
+    Indexing and slicing are positional, so data[i] is the frame with number i only if frame numbers are contiguous
+    and start at 0. Use get_frames to select frames by their 'frame' number and get_period to select one half.
+
+        Attributes:
+
+            source bytes or mmap:
+                raw JSON or newline delimited JSON bytes backing the frames
+    """
+
+    def __init__(self, source):
+        """
+        :param bytes source: raw JSON array or newline delimited JSON bytes of a tracking data response
+        """
+
+        self.source = source
+        self._file = None
+        self._offsets = []
+        self._frame_numbers = []
+        self._frame_periods = []
+        self._periods = {}
+        self._decoder = json.JSONDecoder()
+        self._complete = False
+
+        self._load_window(0)
+        position = _WHITESPACE.match(self._window).end()
+        # Frames of a JSON array are separated by commas and the array ends with ']', newline delimited frames are
+        # separated by whitespace only and end with the data.
+        self._is_array = self._window[position:position + 1] == '['
+        if self._is_array:
+            position += 1
+        self._separators = _SEPARATORS if self._is_array else _WHITESPACE
+        self._position = position
+
+    @classmethod
+    def from_file(cls, file):
+        """Creates lazy tracking data backed by a memory mapped file (e.g. saved by
+        get_and_save_match_tracking_data).
+
+        :param file: path to the file containing tracking data or binary file object, closed with the returned object
+        :return LazyTrackingData: lazy tracking data object
+        """
+
+        if isinstance(file, (str, bytes, os.PathLike)):
+            logger.debug(f'Memory mapping tracking data file: {file}')
+            file = open(file, 'rb')
+        source = None
+        try:
+            if os.fstat(file.fileno()).st_size == 0:
+                # Empty files can not be memory mapped.
+                file.close()
+                return cls(b'')
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            tracking_data = cls(source)
+        except BaseException:
+            if source is not None:
+                source.close()
+            file.close()
+            raise
+        tracking_data._file = file
+        return tracking_data
+
+    def close(self):
+        """Releases the memory mapped file, if any."""
+
+        if self._file is not None:
+            self.source.close()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _load_window(self, start, size=None):
+        if size is None:
+            size = WINDOW_SIZE
+        # JSON structure is ASCII only, so latin-1 keeps character offsets equal to byte offsets.
+        self._window_start = start
+        self._window = self.source[start:start + size].decode('latin-1')
+        self._window_is_last = start + len(self._window) >= len(self.source)
+
+    def _index_next(self):
+        """Decodes the next not yet indexed frame and stores its byte offsets.
+
+        :return: decoded frame or _END when there are no more frames
+        """
+
+        if self._complete:
+            return _END
+
+        size = WINDOW_SIZE
+        while True:
+            position = self._position - self._window_start
+            if position >= len(self._window) and not self._window_is_last:
+                self._load_window(self._position, size)
+                continue
+
+            position = self._separators.match(self._window, position).end()
+            if position >= len(self._window):
+                if self._window_is_last:
+                    if self._is_array:
+                        raise ValueError('Malformed tracking data: unexpected end of data.')
+                    self._complete = True
+                    return _END
+                self._position = self._window_start + position
+                continue
+
+            if self._is_array and self._window[position] == ']':
+                self._complete = True
+                return _END
+
+            try:
+                frame, end = self._decoder.raw_decode(self._window, position)
+            except json.JSONDecodeError:
+                frame, end = None, None
+
+            # A frame touching the end of the window may be truncated, decode it again from a larger window.
+            if end is None or (end >= len(self._window) and not self._window_is_last):
+                if self._window_is_last:
+                    raise ValueError('Malformed tracking data: invalid frame.')
+                size *= 2
+                self._load_window(self._window_start + position, size)
+                self._position = self._window_start
+                continue
+
+            start = self._window_start + position
+            self._position = self._window_start + end
+            self._offsets.append((start, self._position))
+            if _NON_ASCII.search(self._window, position, end):
+                frame = self._load(len(self._offsets) - 1)
+            self._index_frame(frame)
+            return frame
+
+    def _index_frame(self, frame):
+        """Stores frame number and period of the last indexed frame.
+
+        Frames without 'frame' number keep the number of the previous frame, so frame numbers stay sorted.
+        """
+
+        previous_number = self._frame_numbers[-1] if self._frame_numbers else -1
+        if isinstance(frame, dict):
+            number, period = frame.get('frame'), frame.get('period')
+        else:
+            number, period = None, None
+        self._frame_numbers.append(previous_number if number is None else number)
+        self._frame_periods.append(period)
+
+        index = len(self._frame_numbers) - 1
+        if period is not None:
+            self._periods.setdefault(period, [index, index + 1])[1] = index + 1
+
+    def _frame_position(self, number):
+        """Returns position of the first indexed frame with number greater or equal to the given one."""
+
+        if not self._frame_numbers:
+            return 0
+        # Contiguous frame numbers give the position directly, otherwise fall back to binary search.
+        position = number - self._frame_numbers[0]
+        if 0 <= position < len(self._frame_numbers) and self._frame_numbers[position] == number and \
+                (position == 0 or self._frame_numbers[position - 1] < number):
+            return position
+        return bisect_left(self._frame_numbers, number)
+
+    def get_frames(self, start_frame, end_frame):
+        """Returns frames with 'frame' number from start_frame (inclusive) to end_frame (exclusive).
+
+        Source is indexed only up to end_frame. Frames are expected to be ordered by their number.
+
+        :param int start_frame: number of the first frame
+        :param int end_frame: number of the frame following the last one
+        :return list: frames in the range
+        """
+
+        while not (self._frame_numbers and self._frame_numbers[-1] >= end_frame) and self._index_next() is not _END:
+            pass
+        return [self._load(i) for i in range(self._frame_position(start_frame), self._frame_position(end_frame))]
+
+    def get_period(self, period):
+        """Returns frames of the given period (e.g. 2 for the second half).
+
+        Source is indexed only up to the first frame of a later period.
+
+        :param int period: period number
+        :return list: frames of the period
+        """
+
+        while not (period in self._periods and self._frame_periods[-1] not in (period, None)) and \
+                self._index_next() is not _END:
+            pass
+        if period not in self._periods:
+            return []
+        start, end = self._periods[period]
+        return [self._load(i) for i in range(start, end) if self._frame_periods[i] == period]
+
+    def _index_until(self, index):
+        while len(self._offsets) <= index and self._index_next() is not _END:
+            pass
+
+    def _load(self, index):
+        start, end = self._offsets[index]
+        return json.loads(self.source[start:end])
+
+    def __iter__(self):
+        index = 0
+        while True:
+            if index < len(self._offsets):
+                frame = self._load(index)
+            else:
+                frame = self._index_next()
+                if frame is _END:
+                    return
+            yield frame
+            index += 1
+
+    def __len__(self):
+        while self._index_next() is not _END:
+            pass
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+            if stop is not None and start >= 0 and stop >= 0 and step > 0:
+                # Window of frames, index only as far as needed instead of scanning the whole source.
+                self._index_until(stop - 1)
+                indices = range(start, min(stop, len(self._offsets)), step)
+            else:
+                indices = range(*index.indices(len(self)))
+            return [self._load(i) for i in indices]
+
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError('Tracking data frame index out of range')
+        self._index_until(index)
+        if index >= len(self._offsets):
+            raise IndexError('Tracking data frame index out of range')
+        return self._load(index)